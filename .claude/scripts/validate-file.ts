@@ -12,6 +12,14 @@ import { execFileSync } from "node:child_process";
 import { existsSync, readFileSync } from "node:fs";
 import { dirname, resolve } from "node:path";
 
+// Compiled once at module scope rather than per check / per line
+const RELATIVE_SOURCE_PATTERN = /source\s+\.\.?\//;
+const ECHO_E_PATTERN = /echo\s+-e\s/;
+// Only match lines that actually invoke set (not comments or string literals).
+const SET_U_PATTERN = /^\s*set\s+-[a-z]*u/m;
+// [^\S\n] is \s minus newline, so the multiline match stays on one line
+const BANNER_COMMENT_PATTERN = /^[^\S\n]*\/\/[^\S\n]*[-=*#]{10,}[^\S\n]*$/m;
+
 const file = process.env.CLAUDE_FILE;
 if (!file) {
   process.exit(0);
@@ -57,19 +65,17 @@ if (file.endsWith(".sh")) {
   }
 
   // Check for relative source patterns
-  if (/source\s+\.\.?\//.test(content)) {
+  if (RELATIVE_SOURCE_PATTERN.test(content)) {
     fail(`RELATIVE SOURCE detected in ${file} — breaks curl|bash execution`);
   }
 
   // Check for echo -e (macOS bash 3.x compat)
-  if (/echo\s+-e\s/.test(content)) {
+  if (ECHO_E_PATTERN.test(content)) {
     fail(`echo -e detected in ${file} — use printf instead (macOS bash 3.x compat)`);
   }
 
   // Check for set -u (nounset) — always banned, even alongside set -eo pipefail.
-  // Only match lines that actually invoke set (not comments or string literals).
-  const setUPattern = /^\s*set\s+-[a-z]*u/m;
-  if (setUPattern.test(content)) {
+  if (SET_U_PATTERN.test(content)) {
     fail(`set -u (nounset) detected in ${file} — use \${VAR:-} for optional vars instead`);
   }
 }
@@ -83,12 +89,12 @@ if (file.endsWith(".ts")) {
     process.exit(0);
   }
 
-  // Check for banner comments (lines of 10+ dashes, equals, asterisks, or hashes)
-  const lines = content.split("\n");
-  for (let i = 0; i < lines.length; i++) {
-    if (/^\s*\/\/\s*[-=*#]{10,}\s*$/.test(lines[i])) {
-      fail(`BANNER COMMENT at ${file}:${i + 1} — use // #region Name / // #endregion instead`);
-    }
+  // Check for banner comments (lines of 10+ dashes, equals, asterisks, or hashes).
+  // One scan over the whole file; only a hit pays for finding the line number.
+  const banner = BANNER_COMMENT_PATTERN.exec(content);
+  if (banner) {
+    const line = content.slice(0, banner.index).split("\n").length;
+    fail(`BANNER COMMENT at ${file}:${line} — use // #region Name / // #endregion instead`);
   }
 
   // Find biome config by walking up from the file's directory to the repo root
@@ -279,8 +279,16 @@ async function sendEmail(batch: KeyBatch, url: string): Promise<boolean> {
 }
 
 // --- HTML helpers ---
+const HTML_ESCAPES: Record<string, string> = {
+  "&": "&amp;",
+  "<": "&lt;",
+  ">": "&gt;",
+  '"': "&quot;",
+};
+
+// Single scan with a lookup instead of one full replace pass per character
 function esc(s: string) {
-  return s.replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;").replace(/"/g, "&quot;");
+  return s.replace(/[&<>"]/g, (c) => HTML_ESCAPES[c] ?? c);
 }
 
 function formPage(
@@ -102,6 +102,30 @@ const AGENT_METADATA_FIELDS = [
   "tags",
 ];
 
+// ── Concurrency ─────────────────────────────────────────────────────
+
+// Run fn for every id concurrently (each one is independent network I/O),
+// buffering each id's log lines so output still prints in id order.
+async function forEachConcurrent(
+  ids: string[],
+  fn: (id: string, log: (line: string) => void) => Promise<void>,
+): Promise<void> {
+  const logs = await Promise.all(
+    ids.map(async (id) => {
+      const lines: string[] = [];
+      await fn(id, (line) => {
+        lines.push(line);
+      });
+      return lines;
+    }),
+  );
+  for (const lines of logs) {
+    for (const line of lines) {
+      console.log(line);
+    }
+  }
+}
+
 // ── Source URL validation ────────────────────────────────────────────
 
 async function validateSources(
@@ -118,38 +142,38 @@ async function validateSources(
   assetDir: string,
 ) {
   console.log(`── Validating ${label} source URLs ──`);
-  for (const id of ids) {
+  await forEachConcurrent(ids, async (id, log) => {
     const src = sources[id];
     if (!src) {
       if (entries[id]?.icon) {
-        console.log(`  ✗  ${id}: has icon in manifest but MISSING from ${assetDir}/.sources.json`);
+        log(`  ✗  ${id}: has icon in manifest but MISSING from ${assetDir}/.sources.json`);
         hasErrors = true;
       } else {
-        console.log(`  ⚠  ${id}: no source entry (no icon configured)`);
+        log(`  ⚠  ${id}: no source entry (no icon configured)`);
       }
-      continue;
+      return;
     }
     try {
       const res = await fetch(src.url, {
         method: "HEAD",
       });
       if (!res.ok) {
-        console.log(`  ✗  ${id}: BROKEN source URL (HTTP ${res.status}) → ${src.url}`);
+        log(`  ✗  ${id}: BROKEN source URL (HTTP ${res.status}) → ${src.url}`);
         hasErrors = true;
       } else {
         const contentType = res.headers.get("content-type")?.split(";")[0] ?? "";
         const isImage = contentType.startsWith("image/");
         if (!isImage) {
-          console.log(`  ⚠  ${id}: source URL returns ${contentType}, not an image → ${src.url}`);
+          log(`  ⚠  ${id}: source URL returns ${contentType}, not an image → ${src.url}`);
         } else {
-          console.log(`  ✓  ${id}: OK (${contentType})`);
+          log(`  ✓  ${id}: OK (${contentType})`);
         }
       }
     } catch (err) {
-      console.log(`  ✗  ${id}: UNREACHABLE → ${src.url} (${err})`);
+      log(`  ✗  ${id}: UNREACHABLE → ${src.url} (${err})`);
       hasErrors = true;
     }
-  }
+  });
 }
 
 // ── Generic icon refresh ────────────────────────────────────────────
@@ -168,17 +192,17 @@ async function refreshIconsFor(
   assetDir: string,
 ) {
   console.log(`── Refreshing ${label} icons ──`);
-  for (const id of ids) {
+  await forEachConcurrent(ids, async (id, log) => {
     const src = sources[id];
     if (!src) {
-      console.log(`  ⚠  ${id}: no entry in .sources.json, skipping icon`);
-      continue;
+      log(`  ⚠  ${id}: no entry in .sources.json, skipping icon`);
+      return;
     }
     try {
       const res = await fetch(src.url);
       if (!res.ok) {
-        console.log(`  ⚠  ${id}: icon fetch failed (HTTP ${res.status})`);
-        continue;
+        log(`  ⚠  ${id}: icon fetch failed (HTTP ${res.status})`);
+        return;
       }
       const contentType = res.headers.get("content-type")?.split(";")[0] ?? "";
       const ext = EXT_MAP[contentType] ?? src.ext;
@@ -186,18 +210,18 @@ async function refreshIconsFor(
       const rawUrl = `https://raw.githubusercontent.com/OpenRouterTeam/spawn/main/${assetDir}/${id}.${ext}`;
 
       if (dryRun) {
-        console.log(`  [dry-run] ${id}: would download ${src.url} → ${outPath}`);
+        log(`  [dry-run] ${id}: would download ${src.url} → ${outPath}`);
       } else {
         const buf = Buffer.from(await res.arrayBuffer());
         writeFileSync(outPath, buf);
         entries[id].icon = rawUrl;
         sources[id].ext = ext;
-        console.log(`  ✓  ${id}: icon refreshed (${buf.length} bytes, .${ext})`);
+        log(`  ✓  ${id}: icon refreshed (${buf.length} bytes, .${ext})`);
       }
     } catch (err) {
-      console.log(`  ⚠  ${id}: icon fetch error: ${err}`);
+      log(`  ⚠  ${id}: icon fetch error: ${err}`);
     }
-  }
+  });
 }
 
 // ── GitHub metadata refresh (agents only) ───────────────────────────
@@ -207,15 +231,15 @@ const GITHUB_REPO_PATTERN = /^[a-zA-Z0-9_-]+\/[a-zA-Z0-9_.-]+$/;
 
 async function refreshAgentStats() {
   console.log("── Refreshing agent GitHub stats ──");
-  for (const id of agentIds) {
+  await forEachConcurrent(agentIds, async (id, log) => {
     const agent = agents[id];
     if (!agent.repo) {
-      console.log(`  ⚠  ${id}: no repo field, skipping GitHub metadata`);
-      continue;
+      log(`  ⚠  ${id}: no repo field, skipping GitHub metadata`);
+      return;
     }
     if (!GITHUB_REPO_PATTERN.test(agent.repo)) {
-      console.log(`  ⚠  ${id}: invalid repo format '${agent.repo}', skipping`);
-      continue;
+      log(`  ⚠  ${id}: invalid repo format '${agent.repo}', skipping`);
+      return;
     }
     try {
       const proc = Bun.spawn(
@@ -235,19 +259,19 @@ async function refreshAgentStats() {
       const exitCode = await proc.exited;
       if (exitCode !== 0) {
         const errText = await new Response(proc.stderr).text();
-        console.log(`  ⚠  ${id}: gh api failed: ${errText.trim()}`);
-        continue;
+        log(`  ⚠  ${id}: gh api failed: ${errText.trim()}`);
+        return;
       }
       const data = JSON.parse(out);
       const oldStars = agent.github_stars;
 
       if (dryRun) {
-        console.log(`  [dry-run] ${id}: stars ${oldStars ?? "?"} → ${data.stargazers_count}`);
+        log(`  [dry-run] ${id}: stars ${oldStars ?? "?"} → ${data.stargazers_count}`);
         if (data.license && data.license !== agent.license) {
-          console.log(`  [dry-run] ${id}: license ${agent.license ?? "?"} → ${data.license}`);
+          log(`  [dry-run] ${id}: license ${agent.license ?? "?"} → ${data.license}`);
         }
         if (data.language && data.language !== agent.language) {
-          console.log(`  [dry-run] ${id}: language ${agent.language ?? "?"} → ${data.language}`);
+          log(`  [dry-run] ${id}: language ${agent.language ?? "?"} → ${data.language}`);
         }
       } else {
         agent.github_stars = data.stargazers_count;
@@ -262,12 +286,12 @@ async function refreshAgentStats() {
           oldStars != null
             ? ` (${data.stargazers_count - oldStars >= 0 ? "+" : ""}${data.stargazers_count - oldStars})`
             : "";
-        console.log(`  ✓  ${id}: ${data.stargazers_count} stars${delta}`);
+        log(`  ✓  ${id}: ${data.stargazers_count} stars${delta}`);
       }
     } catch (err) {
-      console.log(`  ⚠  ${id}: GitHub metadata error: ${err}`);
+      log(`  ⚠  ${id}: GitHub metadata error: ${err}`);
     }
-  }
+  });
 }
 
 // ── Metadata completeness check ─────────────────────────────────────
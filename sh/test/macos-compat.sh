@@ -64,120 +64,153 @@ trap 'rm -f "$_findings"' EXIT
 
 # grep_rule: fast grep-based rule check, appends findings to $_findings
 # Filters out comment lines (leading whitespace + #)
-# Args: severity rule_id message file relpath pattern
+# Matches are filtered and formatted in a single awk pass instead of a
+# shell read loop (which reads byte-at-a-time); awk only runs on a hit.
+# Optional skip_pattern drops matching lines in the same awk pass (two-pass rules).
+# Args: severity rule_id message file relpath pattern [skip_pattern]
 grep_rule() {
-    local sev="$1" rule="$2" msg="$3" file="$4" rel="$5" pattern="$6"
-    grep -nE "$pattern" "$file" 2>/dev/null | while IFS=: read -r lnum content; do
-        # Skip comment lines
-        case "$(printf '%s' "$content" | sed 's/^[[:space:]]*//')" in
-            '#'*) continue ;;
-        esac
-        printf '%s %s:%s %s %s\n' "$sev" "$rel" "$lnum" "$rule" "$msg"
-    done >> "$_findings" || true
+    local sev="$1" rule="$2" msg="$3" file="$4" rel="$5" pattern="$6" skip="${7:-}" matches
+    matches="$(grep -nE "$pattern" "$file" 2>/dev/null)" || return 0
+    printf '%s\n' "$matches" \
+        | awk -v pre="$sev $rel" -v post="$rule $msg" -v skip="$skip" \
+            '!/^[0-9]+:[[:space:]]*#/ && (skip == "" || $0 !~ skip) {
+                sub(/:.*/, ""); print pre ":" $0 " " post
+            }' \
+        >> "$_findings"
 }
 
+# Rule patterns (ERE). Each rule below greps for one of these; _ANY_RULE_RE
+# is their union, used to skip files that cannot produce any finding.
+MC001_RE='base64.*-w0[[:space:]]+["$]'
+MC002_RE='echo[[:space:]]+-[en]*e[en]*[[:space:]]'
+MC003_RE='(source|\.)[[:space:]]+<\('
+MC004_RE='\(\([[:space:]]*([a-zA-Z_]+[[:space:]]*(\+\+|--)|(\+\+|--)[[:space:]]*[a-zA-Z_]+)[[:space:]]*\)\)'
+MC005_RE='read[[:space:]].*-d'
+MC006_RE='set[[:space:]]+-[a-zA-Z]*u'
+MC007_RE='sed[[:space:]]+-i[[:space:]]'
+MC008_RE='date[[:space:]][^|;]*%N'
+MC009_RE='(local|declare)[[:space:]]+-n[[:space:]]'
+MC010_RE='declare[[:space:]]+-A[[:space:]]'
+MC011_RE='\$\{[a-zA-Z_][a-zA-Z0-9_]*(,,|\^\^)'
+MC012_RE='\|&[^&]'
+MC013_RE='printf[[:space:]]+-v[[:space:]]'
+MC014_RE='\b(readarray|mapfile)\b'
+MC015_RE='\bcoproc\b'
+MC016_RE='&>>'
+MC017_RE='(source|\.)[[:space:]]+\.\.?/'
+MC018_RE='wait[[:space:]]+-n\b'
+MC019_RE='declare[[:space:]]+-[a-zA-Z]*g'
+_ANY_RULE_RE="$MC001_RE|$MC002_RE|$MC003_RE|$MC004_RE|$MC005_RE"
+_ANY_RULE_RE="$_ANY_RULE_RE|$MC006_RE|$MC007_RE|$MC008_RE|$MC009_RE|$MC010_RE|$MC011_RE"
+_ANY_RULE_RE="$_ANY_RULE_RE|$MC012_RE|$MC013_RE|$MC014_RE|$MC015_RE|$MC016_RE|$MC017_RE"
+_ANY_RULE_RE="$_ANY_RULE_RE|$MC018_RE|$MC019_RE"
+
 # Collect all files
 _all_files="$(collect_files | sort)"
 
-# Process each file
+_checked_files=""
 while IFS= read -r _f; do
     [ -z "$_f" ] && continue
     is_excluded "$_f" && continue
-
     FILES_CHECKED=$((FILES_CHECKED + 1))
-    _r="$(printf '%s' "$_f" | sed "s|^${REPO_ROOT}/||")"
+    _checked_files="${_checked_files}${_f}
+"
+done <<FILELIST
+$_all_files
+FILELIST
+
+# Most files are clean: a single batched grep for the union of all rules
+# narrows the set to files that can produce a finding, so only those pay
+# for the per-rule greps below.
+_candidate_files="$(printf '%s' "$_checked_files" | tr '\n' '\0' \
+    | xargs -0 grep -lE "$_ANY_RULE_RE" 2>/dev/null || true)"
+
+# Process each candidate file
+while IFS= read -r _f; do
+    [ -z "$_f" ] && continue
+    _r="${_f#"${REPO_ROOT}"/}"
 
     # MC001: base64 -w0 with file arg (not stdin redirect) — two-pass
-    grep -nE 'base64.*-w0[[:space:]]+["$]' "$_f" 2>/dev/null | while IFS=: read -r lnum content; do
-        case "$(printf '%s' "$content" | sed 's/^[[:space:]]*//')" in '#'*) continue ;; esac
-        printf '%s' "$content" | grep -q '<[[:space:]]' && continue
-        printf 'error %s:%s MC001 %s\n' "$_r" "$lnum" \
-            "'base64 -w0 \$file' (GNU-only) — use 'base64 -w0 < \$file' instead"
-    done >> "$_findings" || true
+    grep_rule "error" "MC001" "'base64 -w0 \$file' (GNU-only) — use 'base64 -w0 < \$file' instead" \
+        "$_f" "$_r" "$MC001_RE" '<[[:space:]]'
 
     # MC002: non-portable echo flags
     _mc002_msg="'echo"
     _mc002_msg="${_mc002_msg} -e' is not portable — use printf instead"
     grep_rule "error" "MC002" "$_mc002_msg" \
-        "$_f" "$_r" 'echo[[:space:]]+-[en]*e[en]*[[:space:]]'
+        "$_f" "$_r" "$MC002_RE"
 
     # MC003: source <(...) or . <(...)
     grep_rule "error" "MC003" "'source <(...)' fails in bash <(curl...) — use eval instead" \
-        "$_f" "$_r" '(source|\.)[[:space:]]+<\('
+        "$_f" "$_r" "$MC003_RE"
 
-    # MC004: ((var++)) or ((var--)) — post-increment
-    grep_rule "error" "MC004" "'((var++))' can fail with set -e — use var=\$((var + 1))" \
-        "$_f" "$_r" '\(\([[:space:]]*[a-zA-Z_]+[[:space:]]*(\+\+|--)[[:space:]]*\)\)'
-
-    # MC004: ((++var)) or ((--var)) — pre-increment
-    grep_rule "error" "MC004" "'((++var))' can fail with set -e — use var=\$((var + 1))" \
-        "$_f" "$_r" '\(\([[:space:]]*(\+\+|--)[[:space:]]*[a-zA-Z_]+[[:space:]]*\)\)'
+    # MC004: ((var++)), ((var--)), ((++var)) or ((--var)) — one alternation
+    grep_rule "error" "MC004" "'((var++))'/'((++var))' can fail with set -e — use var=\$((var + 1))" \
+        "$_f" "$_r" "$MC004_RE"
 
     # MC005: read -d
     grep_rule "error" "MC005" "'read -d' requires bash 4+ — use alternative approach" \
-        "$_f" "$_r" 'read[[:space:]].*-d'
+        "$_f" "$_r" "$MC005_RE"
 
     # MC006: nounset flag (set -u and variants)
     grep_rule "error" "MC006" "'set -u' (nounset) — use \${VAR:-} instead" \
-        "$_f" "$_r" 'set[[:space:]]+-[a-zA-Z]*u'
+        "$_f" "$_r" "$MC006_RE"
 
     # MC007: sed -i without '' (warn only) — two-pass
-    grep -nE "sed[[:space:]]+-i[[:space:]]" "$_f" 2>/dev/null | while IFS=: read -r lnum content; do
-        case "$(printf '%s' "$content" | sed 's/^[[:space:]]*//')" in '#'*) continue ;; esac
-        printf '%s' "$content" | grep -qE "sed[[:space:]]+-i[[:space:]]+''" && continue
-        printf "warn  %s:%s MC007 'sed -i' without '' may fail on macOS\n" "$_r" "$lnum"
-    done >> "$_findings" || true
+    # "warn " is padded to line up with "error" in the output
+    grep_rule "warn " "MC007" "'sed -i' without '' may fail on macOS" \
+        "$_f" "$_r" "$MC007_RE" "sed[[:space:]]+-i[[:space:]]+''"
 
     # MC008: date %N (nanoseconds)
     grep_rule "error" "MC008" "'date %N' (nanoseconds) not available on macOS" \
-        "$_f" "$_r" 'date[[:space:]][^|;]*%N'
+        "$_f" "$_r" "$MC008_RE"
 
     # MC009: local -n / declare -n (namerefs)
     grep_rule "error" "MC009" "'local -n' (namerefs) requires bash 4.3+" \
-        "$_f" "$_r" '(local|declare)[[:space:]]+-n[[:space:]]'
+        "$_f" "$_r" "$MC009_RE"
 
     # MC010: declare -A (associative arrays)
     grep_rule "error" "MC010" "'declare -A' (associative arrays) requires bash 4.0+" \
-        "$_f" "$_r" 'declare[[:space:]]+-A[[:space:]]'
+        "$_f" "$_r" "$MC010_RE"
 
     # MC011: ${var,,} or ${var^^} (case modification)
     grep_rule "error" "MC011" "'\${var,,}'/'\${var^^}' (case modification) requires bash 4.0+" \
-        "$_f" "$_r" '\$\{[a-zA-Z_][a-zA-Z0-9_]*(,,|\^\^)'
+        "$_f" "$_r" "$MC011_RE"
 
     # MC012: |& (pipe stderr)
     grep_rule "error" "MC012" "'|&' (pipe stderr) requires bash 4.0+ — use 2>&1 | instead" \
-        "$_f" "$_r" '\|&[^&]'
+        "$_f" "$_r" "$MC012_RE"
 
     # MC013: printf -v (variable assignment via printf)
     grep_rule "error" "MC013" "'printf -v' requires bash 4.0+ — use eval or stdout capture" \
-        "$_f" "$_r" 'printf[[:space:]]+-v[[:space:]]'
+        "$_f" "$_r" "$MC013_RE"
 
     # MC014: readarray / mapfile (bash 4.0+)
     grep_rule "error" "MC014" "'readarray'/'mapfile' requires bash 4.0+ — use while read loop" \
-        "$_f" "$_r" '\b(readarray|mapfile)\b'
+        "$_f" "$_r" "$MC014_RE"
 
     # MC015: coproc (bash 4.0+)
     grep_rule "error" "MC015" "'coproc' requires bash 4.0+" \
-        "$_f" "$_r" '\bcoproc\b'
+        "$_f" "$_r" "$MC015_RE"
 
     # MC016: &>> (append redirect stderr+stdout, bash 4.0+)
     grep_rule "error" "MC016" "'&>>' requires bash 4.0+ — use >> file 2>&1 instead" \
-        "$_f" "$_r" '&>>'
+        "$_f" "$_r" "$MC016_RE"
 
     # MC017: relative source paths (breaks bash <(curl ...) execution)
     grep_rule "error" "MC017" "relative source path breaks bash <(curl...) — use absolute path or eval" \
-        "$_f" "$_r" '(source|\.)[[:space:]]+\.\.?/'
+        "$_f" "$_r" "$MC017_RE"
 
     # MC018: wait -n (bash 4.3+)
     grep_rule "error" "MC018" "'wait -n' requires bash 4.3+ — use wait with specific PID" \
-        "$_f" "$_r" 'wait[[:space:]]+-n\b'
+        "$_f" "$_r" "$MC018_RE"
 
     # MC019: declare -g (bash 4.2+)
     grep_rule "error" "MC019" "'declare -g' requires bash 4.2+ — use global assignment instead" \
-        "$_f" "$_r" 'declare[[:space:]]+-[a-zA-Z]*g'
+        "$_f" "$_r" "$MC019_RE"
 
 done <<FILELIST
-$_all_files
+$_candidate_files
 FILELIST
 
 # Output findings